@@ -3,9 +3,17 @@
 
 from algosdk.v2client import algod
 from algosdk import transaction, account, mnemonic
-from algosdk.atomic_transaction_composer import AtomicTransactionComposer, AccountTransactionSigner
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AccountTransactionSigner,
+    TransactionWithSigner,
+)
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import json
 
+import msgpack
+
 # Localnet configuration
 ALGOD_ADDRESS = "http://localhost:4001"
 ALGOD_TOKEN = "aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa"
@@ -16,56 +24,170 @@ DISPENSER_MNEMONIC = "legacy nerve ladder alter error federal sibling chat abili
 
 TARGET_ADDRESS = "JIHHW5UA2MAGG5TBVF3E5I5ZYVBBKCFXSY1GFF5CZ87M51KJKY53RSACCM"
 AMOUNT_ALGO = 1000
+AMOUNT_MICROALGOS = AMOUNT_ALGO * 1_000_000
+
+# Algorand allows at most 16 transactions in an atomic group
+MAX_GROUP_SIZE = 16
+# Number of groups submitted to algod concurrently
+MAX_SUBMIT_WORKERS = 16
+
+
+@lru_cache(maxsize=None)
+def get_private_key(account_mnemonic: str) -> str:
+    """
+    Derive the private key for a mnemonic, memoized so repeated sends skip the derivation.
+    Derivation is deferred to the first send so an invalid mnemonic is reported as a send error.
+    """
+    return mnemonic.to_private_key(account_mnemonic)
+
+
+def get_block_tx_ids(client: algod.AlgodClient, round_num: int) -> set[str]:
+    """
+    Return the IDs of all top-level transactions committed in a block.
+    Blocks store transactions with the genesis ID/hash stripped, so they are restored before hashing.
+    """
+    block = msgpack.unpackb(
+        client.block_info(round_num, response_format="msgpack"), raw=False, strict_map_key=False
+    )["block"]
+    tx_ids: set[str] = set()
+    for signed_txn in block.get("txns", []):
+        txn = signed_txn["txn"]
+        if signed_txn.get("hgi"):
+            txn["gen"] = block["gen"]
+        # Networks that require the genesis hash strip it without setting "hgh",
+        # older protocols strip it and set "hgh" - either way it has to be restored
+        txn["gh"] = block["gh"]
+        tx_ids.add(transaction.Transaction.undictify(txn).get_txid())
+    return tx_ids
 
-try:
-    # Initialize client
-    client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+
+def wait_for_confirmed_rounds(
+    client: algod.AlgodClient, tx_ids: list[str], start_round: int, max_rounds: int
+) -> dict[str, int]:
+    """
+    Wait for a set of transactions to be confirmed, using one block read per round.
+    algod's status/wait-for-block-after endpoint blocks server-side until the next round,
+    so the number of requests does not grow with the number of pending transactions.
+    Transactions still missing when the round cap is reached are looked up once each,
+    to report pool rejections.
     
-    # Get suggested params
-    params = client.suggested_params()
+    Args:
+        client: Algod client the transactions were submitted to
+        tx_ids: IDs of the submitted transactions
+        start_round: Last round before the transactions were submitted
+        max_rounds: Number of rounds to wait before giving up
+        
+    Returns:
+        Dict mapping each transaction ID to the round it was confirmed in
+        
+    Raises:
+        Exception: If a transaction was rejected or is still pending after max_rounds
+    """
+    pending = set(tx_ids)
+    confirmed_rounds: dict[str, int] = {}
+    checked_round = start_round
+    while pending and checked_round < start_round + max_rounds:
+        last_round = client.status_after_block(checked_round)["last-round"]
+        # Several rounds may have passed since the last check; scan each of them once
+        for round_num in range(checked_round + 1, min(last_round, start_round + max_rounds) + 1):
+            for tx_id in pending & get_block_tx_ids(client, round_num):
+                confirmed_rounds[tx_id] = round_num
+            pending -= confirmed_rounds.keys()
+            checked_round = round_num
     
-    # Create payment transaction
-    amount_microalgos = int(AMOUNT_ALGO * 1_000_000)
+    if pending:
+        rejections = []
+        for tx_id in sorted(pending):
+            pool_error = client.pending_transaction_info(tx_id).get("pool-error")
+            if pool_error:
+                rejections.append(f"{tx_id} rejected: {pool_error}")
+        if rejections:
+            raise Exception(f"Transaction(s) rejected: {'; '.join(rejections)}")
+        raise Exception(
+            f"{len(pending)} transaction(s) not confirmed after {max_rounds} rounds. "
+            f"Check status with ID(s): {', '.join(sorted(pending))}"
+        )
+    return confirmed_rounds
+
+
+def send_payments(
+    client: algod.AlgodClient,
+    payments: list[tuple[str, int]],
+    max_rounds: int = 10,
+) -> list[str]:
+    """
+    Send payments from the dispenser, grouping up to MAX_GROUP_SIZE per atomic group.
+    Groups are submitted concurrently, then all of them are confirmed together from the committed blocks.
     
-    txn = transaction.PaymentTxn(
-        sender=DISPENSER_ADDRESS,
-        sp=params,
-        receiver=TARGET_ADDRESS,
-        amt=amount_microalgos,
-    )
+    Args:
+        client: Algod client used to submit transactions
+        payments: List of (receiver, amount_microalgos) tuples
+        max_rounds: Number of rounds to wait for all groups to confirm
+        
+    Returns:
+        List of transaction IDs, in the same order as payments
+    """
+    signer = AccountTransactionSigner(get_private_key(DISPENSER_MNEMONIC))
+    params = client.suggested_params()
+    # Suggested params start at the node's last round, so no block committed after submission is missed
+    start_round = params.first_valid
     
-    # Sign transaction with mnemonic
-    private_key = mnemonic.to_private_key(DISPENSER_MNEMONIC)
-    signed_txn = txn.sign(private_key)
+    atcs: list[AtomicTransactionComposer] = []
+    for start in range(0, len(payments), MAX_GROUP_SIZE):
+        atc = AtomicTransactionComposer()
+        for receiver, amt in payments[start:start + MAX_GROUP_SIZE]:
+            txn = transaction.PaymentTxn(
+                sender=DISPENSER_ADDRESS,
+                sp=params,
+                receiver=receiver,
+                amt=amt,
+            )
+            atc.add_transaction(TransactionWithSigner(txn, signer))
+        atcs.append(atc)
     
-    # Submit transaction
-    tx_id = client.send_transaction(signed_txn)
+    # Sign and submit all groups in parallel - submission is bound by HTTP round-trips, not CPU
+    with ThreadPoolExecutor(max_workers=MAX_SUBMIT_WORKERS) as executor:
+        futures = [executor.submit(atc.submit, client) for atc in atcs]
     
-    # Wait for confirmation
-    import time
-    max_rounds = 10
-    round_num = 0
+    # Collect every group's outcome so one failed submission does not hide the groups that went through
+    group_tx_ids: list[list[str]] = []
+    errors: list[Exception] = []
+    for future in futures:
+        try:
+            group_tx_ids.append(future.result())
+        except Exception as e:
+            errors.append(e)
     
-    print(f"Sending {AMOUNT_ALGO} ALGO to {TARGET_ADDRESS}...")
-    print(f"Transaction ID: {tx_id}")
+    for ids in group_tx_ids:
+        print(f"Submitted group of {len(ids)} payment(s), transaction IDs: {', '.join(ids)}")
     
-    while round_num < max_rounds:
-        try:
-            pending_txn = client.pending_transaction_info(tx_id)
-            if 'confirmed-round' in pending_txn:
-                print(f"✅ Transaction confirmed in round {pending_txn['confirmed-round']}")
-                print(f"✅ Account {TARGET_ADDRESS} now has {AMOUNT_ALGO} ALGO!")
-                break
-        except Exception:
-            pass
-        
-        round_num += 1
-        time.sleep(1)
+    if errors:
+        raise Exception(
+            f"{len(errors)} of {len(atcs)} group(s) failed to submit; "
+            f"{len(group_tx_ids)} group(s) listed above were submitted"
+        ) from errors[0]
     
-    if round_num >= max_rounds:
-        print(f"⏱️  Transaction pending... Check status with ID: {tx_id}")
+    # All transactions in a group are confirmed in the same round, so tracking one per group is enough
+    confirmed_rounds = wait_for_confirmed_rounds(client, [ids[0] for ids in group_tx_ids], start_round, max_rounds)
+    tx_ids: list[str] = []
+    for ids in group_tx_ids:
+        print(f"✅ Group of {len(ids)} payment(s) confirmed in round {confirmed_rounds[ids[0]]}")
+        tx_ids.extend(ids)
     
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    return tx_ids
+
+
+if __name__ == "__main__":
+    try:
+        # Initialize client
+        client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_ADDRESS)
+        
+        print(f"Sending {AMOUNT_ALGO} ALGO to {TARGET_ADDRESS}...")
+        tx_ids = send_payments(client, [(TARGET_ADDRESS, AMOUNT_MICROALGOS)])
+        print(f"Transaction ID: {tx_ids[0]}")
+        print(f"✅ Account {TARGET_ADDRESS} now has {AMOUNT_ALGO} ALGO!")
+        
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
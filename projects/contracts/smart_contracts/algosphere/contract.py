@@ -9,17 +9,36 @@ from algopy import (
     Account,
     BoxMap,
     Global,
+    GlobalState,
     String,
     UInt64,
     Txn,
+    arc4,
     gtxn,
     itxn,
     op,
+    subroutine,
     Bytes,
 )
 from algopy.arc4 import abimethod, Bool
 
 
+class Event(arc4.Struct):
+    """
+    On-chain record for a single event.
+    All fields are packed into one box so an event can be read or updated with a single box access.
+    """
+
+    club: arc4.Address          # The club owner/creator
+    name: arc4.DynamicBytes     # Event name
+    venue: arc4.DynamicBytes    # Event location
+    date: arc4.UInt64           # Event timestamp (Unix)
+    price: arc4.UInt64          # Ticket price in microALGOs
+    total: arc4.UInt64          # Total tickets available
+    sold: arc4.UInt64           # Tickets sold/distributed so far
+    asset: arc4.UInt64          # ASA ID of the ticket NFT
+
+
 class AlgoSphere(ARC4Contract):
     """
     AlgoSphere: Main contract for decentralized event ticketing on Algorand.
@@ -30,7 +49,8 @@ class AlgoSphere(ARC4Contract):
     - Ticket purchasing and transfers
     - Ticket verification for check-in and attendance tracking
     
-    Storage uses BoxMaps for efficient on-chain data management and scalability.
+    Storage uses BoxMaps for efficient on-chain data management and scalability,
+    with each event packed into a single box.
     """
 
     def __init__(self) -> None:
@@ -41,18 +61,20 @@ class AlgoSphere(ARC4Contract):
         # Club management: Maps club wallet address → club name (Bytes)
         self.club_names = BoxMap(Account, Bytes, key_prefix=b"c")
         
-        # Event management: Multiple maps indexed by event_id (UInt64)
-        self.event_clubs = BoxMap(UInt64, Account, key_prefix=b"ec")    # The club owner/creator
-        self.event_names = BoxMap(UInt64, Bytes, key_prefix=b"en")      # Event name
-        self.event_venues = BoxMap(UInt64, Bytes, key_prefix=b"ev")     # Event location
-        self.event_dates = BoxMap(UInt64, UInt64, key_prefix=b"ed")     # Event timestamp (Unix)
-        self.event_prices = BoxMap(UInt64, UInt64, key_prefix=b"ep")    # Ticket price in microALGOs
-        self.event_total = BoxMap(UInt64, UInt64, key_prefix=b"et")     # Total tickets available
-        self.event_sold = BoxMap(UInt64, UInt64, key_prefix=b"es")      # Tickets sold/distributed so far
-        self.event_assets = BoxMap(UInt64, UInt64, key_prefix=b"ea")    # ASA ID of the ticket NFT
+        # Event management: Maps event_id (UInt64) → packed Event record
+        self.events = BoxMap(UInt64, Event, key_prefix=b"e")
         
         # Global counter for generating unique event IDs
-        self.event_counter = UInt64(0)
+        self.event_counter = GlobalState(UInt64(0), key=b"n")
+
+    @subroutine
+    def _load_event(self, event_id: UInt64) -> Event:
+        """
+        Load an event record with a single box read, failing if the event doesn't exist.
+        """
+        raw_event, exists = op.Box.get(self.events.key_prefix + op.itob(event_id))
+        assert exists, "Event not found"
+        return Event.from_bytes(raw_event)
 
     @abimethod()
     def register_club(self, club_name: String, contact: String) -> String:
@@ -71,8 +93,8 @@ class AlgoSphere(ARC4Contract):
             Assertion Error: If the caller's address is already registered as a club
         """
         # Check if club already registered - prevent duplicate registrations
-        existing_name, exists = self.club_names.maybe(Txn.sender)
-        assert not exists, "Club already registered"
+        # Membership test only checks the box length, without loading the stored name
+        assert Txn.sender not in self.club_names, "Club already registered"
         
         # Store club name on-chain using the caller's address as key
         # Contact info can be stored off-chain or in a separate box if needed for privacy
@@ -107,8 +129,7 @@ class AlgoSphere(ARC4Contract):
             Assertion Error: If caller is not a registered club, parameters are invalid, or constraints are violated
         """
         # Access control: Only registered clubs can create events
-        club_name_val, club_exists = self.club_names.maybe(Txn.sender)
-        assert club_exists, "Only registered clubs can create events"
+        assert Txn.sender in self.club_names, "Only registered clubs can create events"
         
         # Input validation: Ensure all parameters meet business logic requirements
         assert event_date > Global.latest_timestamp, "Event must be scheduled for the future"
@@ -116,36 +137,38 @@ class AlgoSphere(ARC4Contract):
         assert ticket_count > 0, "Must have at least 1 ticket available"
         assert ticket_count <= 10000, "Cannot create more than 10000 tickets per event (ASA limitation)"
         
-        # Generate unique event ID by incrementing counter
-        self.event_counter += UInt64(1)
-        event_id = self.event_counter
+        # Generate unique event ID by incrementing counter (single read of the counter)
+        event_id = self.event_counter.value + UInt64(1)
+        self.event_counter.value = event_id
         
         # Create ticket ASA (Algorand Standard Asset) - each ticket is an NFT
+        # The app address is read once and reused for the ASA role addresses
+        app_addr = Global.current_application_address
         ticket_asa = itxn.AssetConfig(
             total=ticket_count,
             decimals=0,  # Tickets are non-divisible
-            default_frozen=False,
             unit_name=String("TKT"),
             asset_name=event_name,
             url=String("https://campus-tix.algo"),
-            manager=Global.current_application_address,
-            reserve=Global.current_application_address,
-            freeze=Global.current_application_address,
-            clawback=Global.current_application_address,
-            fee=UInt64(15000),  # Increased fee for inner ASA creation transaction
+            manager=app_addr,
+            reserve=app_addr,
+            # freeze/clawback are never used, so they are left unset (zero address)
+            fee=UInt64(2000),
         ).submit()
         
         ticket_asset_id = ticket_asa.created_asset.id
         
-        # Store event information in separate boxes
-        self.event_clubs[event_id] = Txn.sender
-        self.event_names[event_id] = event_name.bytes
-        self.event_venues[event_id] = venue.bytes
-        self.event_dates[event_id] = event_date
-        self.event_prices[event_id] = ticket_price
-        self.event_total[event_id] = ticket_count
-        self.event_sold[event_id] = UInt64(0)
-        self.event_assets[event_id] = ticket_asset_id
+        # Store all event information in a single box
+        self.events[event_id] = Event(
+            club=arc4.Address(Txn.sender),
+            name=arc4.DynamicBytes(event_name.bytes),
+            venue=arc4.DynamicBytes(venue.bytes),
+            date=arc4.UInt64(event_date),
+            price=arc4.UInt64(ticket_price),
+            total=arc4.UInt64(ticket_count),
+            sold=arc4.UInt64(0),
+            asset=arc4.UInt64(ticket_asset_id),
+        )
         
         return event_id
 
@@ -170,22 +193,18 @@ class AlgoSphere(ARC4Contract):
         Raises:
             Assertion Error: If event doesn't exist, no tickets available, payment is incorrect, etc.
         """
-        # Verify event exists in our storage
-        club_owner, exists = self.event_clubs.maybe(event_id)
-        assert exists, "Event not found"
+        # Verify event exists and load its record with a single box read
+        event = self._load_event(event_id)
         
-        # Retrieve event details from storage - all events have these fields
-        ticket_price, price_exists = self.event_prices.maybe(event_id)
-        total_tickets, total_exists = self.event_total.maybe(event_id)
-        sold_tickets, sold_exists = self.event_sold.maybe(event_id)
-        ticket_asset_id, asset_exists = self.event_assets.maybe(event_id)
+        sold_tickets = event.sold.native
+        ticket_asset_id = event.asset.native
         
         # Business logic: Check ticket availability
-        assert sold_tickets < total_tickets, "Event sold out - no tickets remaining"
+        assert sold_tickets < event.total.native, "Event sold out - no tickets remaining"
         
         # Payment verification: Ensure the grouped payment matches our requirements
-        assert payment.receiver == club_owner, "Payment must be sent to the event organizer (club)"
-        assert payment.amount == ticket_price, "Payment amount must match ticket price exactly"
+        assert payment.receiver == event.club.native, "Payment must be sent to the event organizer (club)"
+        assert payment.amount == event.price.native, "Payment amount must match ticket price exactly"
         assert payment.sender == Txn.sender, "Payment must come from ticket buyer"
         
         # Transfer 1 ticket ASA to the buyer from the contract's holding
@@ -199,7 +218,8 @@ class AlgoSphere(ARC4Contract):
         ).submit()
         
         # Update sold counter to track capacity and prevent double-selling
-        self.event_sold[event_id] = sold_tickets + UInt64(1)
+        event.sold = arc4.UInt64(sold_tickets + 1)
+        self.events[event_id] = event.copy()
         
         return ticket_asset_id
 
@@ -224,16 +244,15 @@ class AlgoSphere(ARC4Contract):
             Assertion Error: If the event doesn't exist
         """
         # Get the ticket ASA ID for this event
-        ticket_asset_id, exists = self.event_assets.maybe(event_id)
-        assert exists, "Event not found"
+        ticket_asset_id = self._load_event(event_id).asset.native
         
         # Query the attendee's balance of the ticket ASA
-        # Returns (balance, opted_in) tuple for the account's holding of this asset
-        asset_balance, balance_exists = op.AssetHoldingGet.asset_balance(attendee, ticket_asset_id)
+        # Balance is reported as 0 when the account has not opted in, so the opted-in flag is not needed
+        asset_balance, _opted_in = op.AssetHoldingGet.asset_balance(attendee, ticket_asset_id)
         
-        # Return True if attendee has opted-in AND has at least 1 ticket
+        # Return True if attendee has at least 1 ticket
         # This enables efficient check-in at the event venue
-        return Bool(balance_exists and asset_balance > 0)
+        return Bool(asset_balance > 0)
 
     @abimethod(readonly=True)
     def get_event_details(
@@ -261,29 +280,28 @@ class AlgoSphere(ARC4Contract):
         Raises:
             Assertion Error: If the event doesn't exist
         """
-        # Retrieve club/organizer who created this event
-        club_owner, exists = self.event_clubs.maybe(event_id)
-        assert exists, "Event not found"
-        
-        # Retrieve all event metadata from storage boxes
-        event_name, name_exists = self.event_names.maybe(event_id)
-        venue, venue_exists = self.event_venues.maybe(event_id)
-        date, date_exists = self.event_dates.maybe(event_id)
-        price, price_exists = self.event_prices.maybe(event_id)
-        total, total_exists = self.event_total.maybe(event_id)
-        sold, sold_exists = self.event_sold.maybe(event_id)
-        asset_id, asset_exists = self.event_assets.maybe(event_id)
+        # Retrieve the full event record with a single box read
+        event = self._load_event(event_id)
         
         # Return all event data as tuple for frontend consumption
-        return club_owner.bytes, event_name, venue, date, price, total, sold, asset_id
+        return (
+            event.club.bytes,
+            event.name.bytes[2:],  # Strip the ARC-4 length prefix
+            event.venue.bytes[2:],
+            event.date.native,
+            event.price.native,
+            event.total.native,
+            event.sold.native,
+            event.asset.native,
+        )
 
     @abimethod(readonly=True)
-    def get_club_name(self, club_address: Bytes) -> Bytes:
+    def get_club_name(self, club_address: Account) -> Bytes:
         """
         Retrieve the registered name of a club by its wallet address.
         
         Args:
-            club_address: Wallet address (bytes) of the club to look up
+            club_address: Wallet address of the club to look up
             
         Returns:
             Registered club name as bytes
@@ -291,9 +309,7 @@ class AlgoSphere(ARC4Contract):
         Raises:
             Assertion Error: If the address is not registered as a club
         """
-        # Convert Bytes input to Account type for BoxMap lookup
-        club_account = Account(club_address)
-        club_name, exists = self.club_names.maybe(club_account)
+        club_name, exists = self.club_names.maybe(club_address)
         assert exists, "Club not registered"
         return club_name
 
@@ -306,7 +322,7 @@ class AlgoSphere(ARC4Contract):
         Returns:
             Total event count (includes all events regardless of status)
         """
-        return self.event_counter
+        return self.event_counter.value
 
     @abimethod(readonly=True)
     def is_club_registered(self, club_address: Account) -> Bool:
@@ -320,5 +336,5 @@ class AlgoSphere(ARC4Contract):
         Returns:
             True if the address is registered as a club, False otherwise
         """
-        club_name_val, exists = self.club_names.maybe(club_address)
-        return Bool(exists)
+        # Existence check via box length - the club name itself is never read
+        return Bool(club_address in self.club_names)
@@ -0,0 +1,67 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import String, UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.algosphere.contract import AlgoSphere
+
+EVENT_DATE = 2_000_000_000
+TICKET_PRICE = 1_000_000
+TICKET_COUNT = 50
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.ledger.patch_global_fields(latest_timestamp=1_700_000_000)
+        yield ctx
+
+
+def test_create_buy_and_read_event(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = AlgoSphere()
+    club = context.any.account()
+    buyer = context.any.account()
+
+    with context.txn.create_group(active_txn_overrides={"sender": club}):
+        contract.register_club(String("Tech Club"), String("tech@example.com"))
+    with context.txn.create_group(active_txn_overrides={"sender": club}):
+        event_id = contract.create_event(
+            String("Tech Talk"),
+            String("Main Hall"),
+            UInt64(EVENT_DATE),
+            UInt64(TICKET_PRICE),
+            UInt64(TICKET_COUNT),
+        )
+
+    # Act
+    payment = context.any.txn.payment(sender=buyer, receiver=club, amount=UInt64(TICKET_PRICE))
+    with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+        asset_id = contract.buy_ticket(event_id, payment)
+    club_owner, name, venue, date, price, total, sold, event_asset_id = contract.get_event_details(event_id)
+
+    # Assert
+    assert event_id == 1
+    assert club_owner == club.bytes
+    assert name == String("Tech Talk").bytes
+    assert venue == String("Main Hall").bytes
+    assert date == EVENT_DATE
+    assert price == TICKET_PRICE
+    assert total == TICKET_COUNT
+    assert sold == 1
+    assert event_asset_id == asset_id
+
+
+def test_buy_ticket_rejects_unknown_event(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = AlgoSphere()
+    buyer = context.any.account()
+    payment = context.any.txn.payment(sender=buyer, amount=UInt64(TICKET_PRICE))
+
+    # Act / Assert
+    with (
+        pytest.raises(AssertionError, match="Event not found"),
+        context.txn.create_group(active_txn_overrides={"sender": buyer}),
+    ):
+        contract.buy_ticket(UInt64(1), payment)
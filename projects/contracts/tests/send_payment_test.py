@@ -0,0 +1,109 @@
+import base64
+from collections import Counter
+
+import msgpack
+import pytest
+from algosdk import account, transaction
+
+from send_payment import get_block_tx_ids, wait_for_confirmed_rounds
+
+GENESIS_ID = "testnet-v1.0"
+GENESIS_HASH = base64.b64decode("SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=")
+
+
+class _BlockClient:
+    """Serves a single pre-encoded block, as algod's block endpoint does in msgpack format"""
+
+    def __init__(self, block: dict) -> None:
+        self._encoded = msgpack.packb(block, use_bin_type=True)
+
+    def block_info(self, round_num: int, response_format: str = "json") -> bytes:
+        assert response_format == "msgpack"
+        return self._encoded
+
+
+class _ChainClient:
+    """Advances one round per status_after_block call and counts the algod requests made"""
+
+    def __init__(self, blocks: dict[int, dict], pending_info: dict | None = None) -> None:
+        self._encoded = {rnd: msgpack.packb(block, use_bin_type=True) for rnd, block in blocks.items()}
+        self._pending_info = pending_info or {}
+        self.calls: Counter[str] = Counter()
+
+    def status_after_block(self, round_num: int) -> dict:
+        self.calls["status_after_block"] += 1
+        return {"last-round": round_num + 1}
+
+    def block_info(self, round_num: int, response_format: str = "json") -> bytes:
+        self.calls["block_info"] += 1
+        return self._encoded[round_num]
+
+    def pending_transaction_info(self, tx_id: str) -> dict:
+        self.calls["pending_transaction_info"] += 1
+        return self._pending_info
+
+
+def _block(round_num: int, txns: list[transaction.PaymentTxn]) -> dict:
+    return {"block": {"gen": GENESIS_ID, "gh": GENESIS_HASH, "rnd": round_num, "txns": [_in_block(t) for t in txns]}}
+
+
+def _payment(amount: int) -> transaction.PaymentTxn:
+    params = transaction.SuggestedParams(
+        fee=1000, first=100, last=1100, gh=base64.b64encode(GENESIS_HASH).decode(), gen=GENESIS_ID, flat_fee=True
+    )
+    _, sender = account.generate_account()
+    _, receiver = account.generate_account()
+    return transaction.PaymentTxn(sender=sender, sp=params, receiver=receiver, amt=amount)
+
+
+def _in_block(txn: transaction.PaymentTxn) -> dict:
+    """Encode a transaction the way a block stores it: genesis ID and hash stripped, "hgh" unset"""
+    encoded = txn.dictify()
+    del encoded["gen"]
+    del encoded["gh"]
+    return {"txn": encoded, "sig": bytes(64), "hgi": True}
+
+
+def test_get_block_tx_ids_restores_stripped_genesis_fields() -> None:
+    # Arrange
+    txns = [_payment(1_000), _payment(2_000)]
+    block = {"block": {"gen": GENESIS_ID, "gh": GENESIS_HASH, "rnd": 101, "txns": [_in_block(t) for t in txns]}}
+
+    # Act
+    tx_ids = get_block_tx_ids(_BlockClient(block), 101)
+
+    # Assert
+    assert tx_ids == {t.get_txid() for t in txns}
+
+
+def test_get_block_tx_ids_empty_block() -> None:
+    # Arrange
+    block = {"block": {"gen": GENESIS_ID, "gh": GENESIS_HASH, "rnd": 101}}
+
+    # Act / Assert
+    assert get_block_tx_ids(_BlockClient(block), 101) == set()
+
+
+def test_wait_for_confirmed_rounds_reads_one_block_per_round() -> None:
+    # Arrange
+    txns = [_payment(amount) for amount in range(1, 9)]
+    blocks = {101: _block(101, []), 102: _block(102, txns[:4]), 103: _block(103, txns[4:])}
+    client = _ChainClient(blocks)
+
+    # Act
+    confirmed_rounds = wait_for_confirmed_rounds(client, [t.get_txid() for t in txns], 100, 10)
+
+    # Assert
+    assert confirmed_rounds == {t.get_txid(): 102 if i < 4 else 103 for i, t in enumerate(txns)}
+    assert client.calls == Counter(status_after_block=3, block_info=3)
+
+
+def test_wait_for_confirmed_rounds_reports_pool_rejection_after_round_cap() -> None:
+    # Arrange
+    txn = _payment(1_000)
+    client = _ChainClient({101: _block(101, []), 102: _block(102, [])}, {"pool-error": "overspend"})
+
+    # Act / Assert
+    with pytest.raises(Exception, match=f"{txn.get_txid()} rejected: overspend"):
+        wait_for_confirmed_rounds(client, [txn.get_txid()], 100, 2)
+    assert client.calls["pending_transaction_info"] == 1